@@ -8,10 +8,11 @@ Functions collected in this module allow to
 
 from __future__ import annotations
 
-import itertools
-import math
-from collections.abc import Iterable, Sequence
+import functools
+from collections import deque
+from collections.abc import Callable, Sequence
 from decimal import Decimal as UnlimitedNatural
+from operator import attrgetter
 from typing import TypeVar
 
 from gaphor.UML.uml import (
@@ -54,6 +55,8 @@ from gaphor.UML.uml import (
 
 T = TypeVar("T", bound=Element)
 
+_INF = UnlimitedNatural("Infinity")
+
 
 def stereotypes_str(element: Element, stereotypes: Sequence[str] = ()) -> str:
     """Identify stereotypes of a UML metamodel instance and return coma
@@ -66,13 +69,10 @@ def stereotypes_str(element: Element, stereotypes: Sequence[str] = ()) -> str:
         List of additional stereotypes, can be empty.
     """
     # generate string with stereotype names separated by coma
-    if element:
-        applied: Iterable[str] = (
-            stereotype_name(st) for st in get_applied_stereotypes(element)
-        )
-    else:
-        applied = ()
-    if s := ", ".join(itertools.chain(stereotypes, applied)):
+    names = list(stereotypes)
+    if isinstance(element, Element):
+        names.extend(stereotype_name(st) for st in get_applied_stereotypes(element))
+    if s := ", ".join(names):
         return f"«{s}»"
     return ""
 
@@ -88,7 +88,7 @@ def stereotype_name(stereotype: Stereotype) -> str:
     name: str = stereotype.name
     if not name:
         return ""
-    elif len(name) > 1 and name[1].isupper():
+    elif name[0].islower() or len(name) > 1 and name[1].isupper():
         return name
     return name[0].lower() + name[1:]
 
@@ -129,6 +129,11 @@ def remove_stereotype(element: Element, stereotype: Stereotype) -> None:
             break
 
 
+@functools.cache
+def _element_superclass_names(cls: type[Element]) -> frozenset[str]:
+    return frozenset(c.__name__ for c in cls.__mro__ if issubclass(c, Element))
+
+
 def get_stereotypes(element: Element) -> list[Stereotype]:
     """Get sorted collection of possible stereotypes for specified element."""
     model = element.model
@@ -136,31 +141,32 @@ def get_stereotypes(element: Element) -> list[Stereotype]:
     if isinstance(element, Stereotype):
         return []
 
-    cls = type(element)
-
     # find out names of classes, which are superclasses of element class
-    names = {c.__name__ for c in cls.__mro__ if issubclass(c, Element)}
+    names = _element_superclass_names(type(element))
 
     # find stereotypes that extend element class
-    classes: Iterable[Class] = model.select(  # type: ignore[assignment]
-        lambda e: isinstance(e, Class) and e.name in names
-    )
+    classes = (c for c in model.select(Class) if c.name in names)
 
-    stereotypes = list({ext.ownedEnd.type for cls in classes for ext in cls.extension})
+    all_stereotypes = {ext.ownedEnd.type for cls in classes for ext in cls.extension}
 
-    all_stereotypes = stereotypes
-    for s in stereotypes:
+    # add all specializations of the found stereotypes
+    queue = deque(all_stereotypes)
+    while queue:
+        s = queue.popleft()
         for sub in s.specialization[:].specific:
             if isinstance(sub, Stereotype) and sub not in all_stereotypes:
-                all_stereotypes.append(sub)
+                all_stereotypes.add(sub)
+                queue.append(sub)
 
-    return sorted(all_stereotypes, key=lambda st: st.name)
+    return sorted(all_stereotypes, key=attrgetter("name"))
 
 
 def get_applied_stereotypes(element: Element) -> Sequence[Stereotype]:
     """Get collection of applied stereotypes to an element."""
-    return (
-        element.appliedStereotype[:].classifier if isinstance(element, Element) else []  # type: ignore[return-value]
+    return tuple(  # type: ignore[return-value]
+        classifier
+        for obj in element.appliedStereotype
+        for classifier in obj.classifier
     )
 
 
@@ -189,11 +195,9 @@ def create_extension(metaclass: Class, stereotype: Stereotype) -> Extension:
 
 
 def is_metaclass(element: Element) -> bool:
-    return (
-        (not isinstance(element, Stereotype))
-        and hasattr(element, "extension")
-        and bool(element.extension)
-    )
+    if isinstance(element, Stereotype):
+        return False
+    return bool(getattr(element, "extension", None))
 
 
 def add_slot(
@@ -361,20 +365,21 @@ def set_navigability(assoc: Association, end: Property, nav: bool | None) -> Non
     """
     assert end.opposite
     owner = end.opposite.type
+    attribute_owner = owner if isinstance(owner, TYPES_WITH_OWNED_ATTRIBUTE) else None
     # remove "navigable" and "unspecified" navigation indicators first
-    if isinstance(owner, TYPES_WITH_OWNED_ATTRIBUTE) and end in owner.ownedAttribute:
-        owner.ownedAttribute.remove(end)
-    if end in assoc.ownedEnd:
+    if attribute_owner is not None and end in attribute_owner.ownedAttribute:
+        attribute_owner.ownedAttribute.remove(end)
+    if end.owningAssociation is assoc:
         assoc.ownedEnd.remove(end)
-    if end in assoc.navigableOwnedEnd:
+    if end.association2 is assoc:
         assoc.navigableOwnedEnd.remove(end)
 
     assert end not in assoc.ownedEnd
     assert end not in assoc.navigableOwnedEnd
 
     if nav is True:
-        if isinstance(owner, TYPES_WITH_OWNED_ATTRIBUTE):
-            owner.ownedAttribute = end
+        if attribute_owner is not None:
+            attribute_owner.ownedAttribute = end
         else:
             assoc.navigableOwnedEnd = end
     elif nav is None:
@@ -436,9 +441,11 @@ def clone_message(msg, inverted=False):
 
 
 def owner_of_type(element: Element | None, owner_type: type[T]) -> T | None:
-    if element is None or isinstance(element, owner_type):
-        return element
-    return owner_of_type(element.owner, owner_type)
+    while element is not None:
+        if isinstance(element, owner_type):
+            return element
+        element = element.owner
+    return None
 
 
 def owner_package(element: Element | None) -> Package | None:
@@ -457,23 +464,19 @@ def get_property_default_value_as_string(property: Property) -> str | None:
     return get_literal_value_as_string(property.defaultValue)
 
 
+_LITERAL_TO_STRING: dict[type[ValueSpecification], Callable[..., str]] = {
+    LiteralUnlimitedNatural: lambda v: "*" if v.value == _INF else str(int(v.value)),
+    LiteralInteger: lambda v: str(v.value),
+    LiteralString: lambda v: str(v.value),
+    LiteralBoolean: lambda v: "true" if v.value is True else "false",
+}
+
+
 def get_literal_value_as_string(value: ValueSpecification) -> str | None:
     """Get literal value as a string."""
-    if value is None:
+    if (to_string := _LITERAL_TO_STRING.get(type(value))) is None:
         return None
-    if isinstance(value, LiteralUnlimitedNatural):
-        if math.isinf(value.value):
-            return "*"
-        return str(int(value.value))
-    if isinstance(value, LiteralInteger):
-        return str(value.value)
-    if isinstance(value, LiteralString):
-        return str(value.value)
-    if isinstance(value, LiteralBoolean):
-        if value.value is True:
-            return "true"
-        return "false"
-    return None
+    return to_string(value)
 
 
 def set_property_default_value_from_string(
@@ -492,147 +495,61 @@ def set_property_default_value_from_string(
         default_value.owningProperty = property
 
 
-def create_value_specification_for_type_and_value(
-    model, type: str | None, value: str | None
-) -> ValueSpecification | None:
-    if value is None:
-        return None
-    if type is None:
-        if value == "true" or value == "false":
-            type = "bool"
-        elif value.isnumeric():
-            type = "int"
-        else:
-            type = "str"
-    value_specification = None
-    match type:
-        case "bool" | "Boolean":
-            value_specification = model.create(LiteralBoolean)
-            if value == "true":
-                value_specification.value = True
-                value_specification.name = "true"
-            else:
-                value_specification.value = False
-                value_specification.name = "false"
-        case "str" | "String":
-            stripped_value = value.replace('"', "")
-            value_specification = model.create(LiteralString)
-            value_specification.value = value
-            value_specification.name = stripped_value
-        case "int" | "Integer":
-            value_specification = model.create(LiteralInteger)
-            value_specification.value = int(value)
-            value_specification.name = value
-        case "UnlimitedNatural":
-            value_specification = model.create(LiteralUnlimitedNatural)
-            if value == "*":
-                value_specification.value = UnlimitedNatural(math.inf)
-                value_specification.name = "*"
-            else:
-                value_specification.value = UnlimitedNatural(int(value))
-                value_specification.name = value
-        # case "float" | "Real":
-        #     value_specification = model.create(LiteralReal)
-        #     value_specification.value = float(value)
+def _create_literal_boolean(model, value: str) -> LiteralBoolean:
+    value_specification: LiteralBoolean = model.create(LiteralBoolean)
+    value_specification.value = value == "true"
+    value_specification.name = "true" if value == "true" else "false"
     return value_specification
 
 
-def get_property_lower_value(property: Property) -> int | None:
-    """Get lower value of a property."""
-    if property.lowerValue is None:
-        return None
-    if isinstance(property.lowerValue, LiteralInteger):
-        return int(property.lowerValue.value)
-    return None
+def _create_literal_string(model, value: str) -> LiteralString:
+    value_specification: LiteralString = model.create(LiteralString)
+    value_specification.value = value
+    value_specification.name = value.replace('"', "")
+    return value_specification
 
 
-def get_property_lower_value_as_string(property: Property) -> str | None:
-    """Get lower value of a property as a string."""
-    if property.lowerValue is None:
-        return None
-    if isinstance(property.lowerValue, LiteralInteger):
-        return str(property.lowerValue.value)
-    return None
+def _create_literal_integer(model, value: str) -> LiteralInteger:
+    value_specification: LiteralInteger = model.create(LiteralInteger)
+    value_specification.value = int(value)
+    value_specification.name = value
+    return value_specification
 
 
-def set_property_lower_value(property: Property, value: int | None) -> None:
-    """Set lower value of a property."""
-    if property.lowerValue:
-        property.lowerValue.unlink()
-    if value is None:
-        return
-    lower_value = property.model.create(LiteralInteger)
-    property.lowerValue = lower_value
-    lower_value.owningLower = property
-    property.lowerValue.value = value
-    property.lowerValue.name = str(value)
+def _create_literal_unlimited_natural(model, value: str) -> LiteralUnlimitedNatural:
+    value_specification: LiteralUnlimitedNatural = model.create(LiteralUnlimitedNatural)
+    value_specification.value = _INF if value == "*" else UnlimitedNatural(int(value))
+    value_specification.name = value
+    return value_specification
 
 
-def set_property_lower_value_from_string(property: Property, value: str | None) -> None:
-    """Set lower value of a property from a string."""
-    if property.lowerValue:
-        property.lowerValue.unlink()
-    if value is None:
-        return
-    lower_value = property.model.create(LiteralInteger)
-    property.lowerValue = lower_value
-    lower_value.owningLower = property
-    property.lowerValue.value = int(value)
-    property.lowerValue.name = value
+_VALUE_SPECIFICATION_FACTORIES: dict[str, Callable[..., ValueSpecification]] = {
+    "bool": _create_literal_boolean,
+    "Boolean": _create_literal_boolean,
+    "str": _create_literal_string,
+    "String": _create_literal_string,
+    "int": _create_literal_integer,
+    "Integer": _create_literal_integer,
+    "UnlimitedNatural": _create_literal_unlimited_natural,
+    # "float" and "Real" (LiteralReal) are not supported yet
+}
 
 
-def get_property_upper_value(property: Property) -> UnlimitedNatural | None:
-    """Get upper value of a property."""
-    if property.upperValue is None:
+def create_value_specification_for_type_and_value(
+    model, type: str | None, value: str | None
+) -> ValueSpecification | None:
+    if value is None:
         return None
-    if isinstance(property.upperValue, LiteralUnlimitedNatural):
-        return UnlimitedNatural(property.upperValue.value)
-    return None
-
-
-def get_property_upper_value_as_string(property: Property) -> str | None:
-    """Get upper value of a property as a string."""
-    if property.upperValue is None:
+    if type is None:
+        if value == "true" or value == "false":
+            type = "bool"
+        elif value.isnumeric():
+            type = "int"
+        else:
+            type = "str"
+    if (factory := _VALUE_SPECIFICATION_FACTORIES.get(type)) is None:
         return None
-    if isinstance(property.upperValue, LiteralUnlimitedNatural):
-        if math.isinf(property.upperValue.value):
-            return "*"
-        return str(int(property.upperValue.value))
-    return None
-
-
-def set_property_upper_value(
-    property: Property, value: UnlimitedNatural | None
-) -> None:
-    """Set upper value of a property."""
-    if property.upperValue:
-        property.upperValue.unlink()
-    if value is None:
-        return
-    upper_value = property.model.create(LiteralUnlimitedNatural)
-    property.upperValue = upper_value
-    upper_value.owningUpper = property
-    property.upperValue.value = value
-    if math.isinf(value):
-        property.upperValue.name = "*"
-    else:
-        property.upperValue.name = str(int(value))
-
-
-def set_property_upper_value_from_string(property: Property, value: str | None) -> None:
-    """Set upper value of a property from a string."""
-    if property.upperValue:
-        property.upperValue.unlink()
-    if value is None:
-        return
-    upper_value = property.model.create(LiteralUnlimitedNatural)
-    property.upperValue = upper_value
-    upper_value.owningUpper = property
-    if value == "*":
-        property.upperValue.value = UnlimitedNatural(math.inf)
-    else:
-        property.upperValue.value = UnlimitedNatural(int(value))
-    property.upperValue.name = value
+    return factory(model, value)
 
 
 def get_multiplicity_lower_value(multiplicity: MultiplicityElement) -> int | None:
@@ -703,7 +620,7 @@ def get_multiplicity_upper_value_as_string(
     if multiplicity.upperValue is None:
         return None
     if isinstance(multiplicity.upperValue, LiteralUnlimitedNatural):
-        if math.isinf(multiplicity.upperValue.value):
+        if multiplicity.upperValue.value == _INF:
             return "*"
         return str(int(multiplicity.upperValue.value))
     return None
@@ -721,7 +638,7 @@ def set_multiplicity_upper_value(
     multiplicity.upperValue = upper_value
     upper_value.owningUpper = multiplicity
     multiplicity.upperValue.value = value
-    if math.isinf(value):
+    if value == _INF:
         multiplicity.upperValue.name = "*"
     else:
         multiplicity.upperValue.name = str(int(value))
@@ -739,12 +656,23 @@ def set_multiplicity_upper_value_from_string(
     multiplicity.upperValue = upper_value
     upper_value.owningUpper = multiplicity
     if value == "*":
-        multiplicity.upperValue.value = UnlimitedNatural(math.inf)
+        multiplicity.upperValue.value = _INF
     else:
         multiplicity.upperValue.value = UnlimitedNatural(int(value))
     multiplicity.upperValue.name = value
 
 
+# Properties and parameters are multiplicity elements.
+get_property_lower_value = get_multiplicity_lower_value
+get_property_lower_value_as_string = get_multiplicity_lower_value_as_string
+set_property_lower_value = set_multiplicity_lower_value
+set_property_lower_value_from_string = set_multiplicity_lower_value_from_string
+get_property_upper_value = get_multiplicity_upper_value
+get_property_upper_value_as_string = get_multiplicity_upper_value_as_string
+set_property_upper_value = set_multiplicity_upper_value
+set_property_upper_value_from_string = set_multiplicity_upper_value_from_string
+
+
 def get_parameter_default_value(parameter: Parameter) -> ValueSpecification | None:
     """Get default value of a parameter."""
     return parameter.defaultValue
@@ -785,103 +713,11 @@ def set_parameter_default_value_from_string(
         default_value.owningParameter = parameter
 
 
-def get_parameter_lower_value(parameter: Parameter) -> int | None:
-    """Get lower value of a parameter."""
-    if parameter.lowerValue is None:
-        return None
-    if isinstance(parameter.lowerValue, LiteralInteger):
-        return int(parameter.lowerValue.value)
-    return None
-
-
-def get_parameter_lower_value_as_string(parameter: Parameter) -> str | None:
-    """Get lower value of a parameter as a string."""
-    if parameter.lowerValue is None:
-        return None
-    if isinstance(parameter.lowerValue, LiteralInteger):
-        return str(parameter.lowerValue.value)
-    return None
-
-
-def set_parameter_lower_value(parameter: Parameter, value: int | None) -> None:
-    """Set lower value of a parameter."""
-    if parameter.lowerValue:
-        parameter.lowerValue.unlink()
-    if value is None:
-        return
-    lower_value = parameter.model.create(LiteralInteger)
-    parameter.lowerValue = lower_value
-    lower_value.owningLower = parameter
-    parameter.lowerValue.value = value
-    parameter.lowerValue.name = str(value)
-
-
-def set_parameter_lower_value_from_string(
-    parameter: Parameter, value: str | None
-) -> None:
-    """Set lower value of a parameter from a string."""
-    if parameter.lowerValue:
-        parameter.lowerValue.unlink()
-    if value is None:
-        return
-    lower_value = parameter.model.create(LiteralInteger)
-    parameter.lowerValue = lower_value
-    lower_value.owningLower = parameter
-    parameter.lowerValue.value = int(value)
-    parameter.lowerValue.name = value
-
-
-def get_parameter_upper_value(parameter: Parameter) -> UnlimitedNatural | None:
-    """Get upper value of a parameter."""
-    if parameter.upperValue is None:
-        return None
-    if isinstance(parameter.upperValue, LiteralUnlimitedNatural):
-        return UnlimitedNatural(parameter.upperValue.value)
-    return None
-
-
-def get_parameter_upper_value_as_string(parameter: Parameter) -> str | None:
-    """Get upper value of a parameter as a string."""
-    if parameter.upperValue is None:
-        return None
-    if isinstance(parameter.upperValue, LiteralUnlimitedNatural):
-        if math.isinf(parameter.upperValue.value):
-            return "*"
-        return str(int(parameter.upperValue.value))
-    return None
-
-
-def set_parameter_upper_value(
-    parameter: Parameter, value: UnlimitedNatural | None
-) -> None:
-    """Set upper value of a parameter."""
-    if parameter.upperValue:
-        parameter.upperValue.unlink()
-    if value is None:
-        return
-    upper_value = parameter.model.create(LiteralUnlimitedNatural)
-    parameter.upperValue = upper_value
-    upper_value.owningUpper = parameter
-    parameter.upperValue.value = value
-    if math.isinf(value):
-        parameter.upperValue.name = "*"
-    else:
-        parameter.upperValue.name = str(int(value))
-
-
-def set_parameter_upper_value_from_string(
-    parameter: Parameter, value: str | None
-) -> None:
-    """Set upper value of a parameter from a string."""
-    if parameter.upperValue:
-        parameter.upperValue.unlink()
-    if value is None:
-        return
-    upper_value = parameter.model.create(LiteralUnlimitedNatural)
-    parameter.upperValue = upper_value
-    upper_value.owningUpper = parameter
-    if value == "*":
-        parameter.upperValue.value = UnlimitedNatural(math.inf)
-    else:
-        parameter.upperValue.value = UnlimitedNatural(int(value))
-    parameter.upperValue.name = value
+get_parameter_lower_value = get_multiplicity_lower_value
+get_parameter_lower_value_as_string = get_multiplicity_lower_value_as_string
+set_parameter_lower_value = set_multiplicity_lower_value
+set_parameter_lower_value_from_string = set_multiplicity_lower_value_from_string
+get_parameter_upper_value = get_multiplicity_upper_value
+get_parameter_upper_value_as_string = get_multiplicity_upper_value_as_string
+set_parameter_upper_value = set_multiplicity_upper_value
+set_parameter_upper_value_from_string = set_multiplicity_upper_value_from_string
@@ -128,6 +128,16 @@ def test_inherited_stereotype(element_factory):
     assert substereotype in stereotypes
 
 
+def test_stereotypes_only_from_metaclasses(element_factory):
+    """Test if elements other than classes are not used as metaclass."""
+    package = element_factory.create(UML.Package)
+    package.name = "Class"
+
+    c = element_factory.create(UML.Class)
+
+    assert [] == UML.recipes.get_stereotypes(c)
+
+
 # Association tests
 
 